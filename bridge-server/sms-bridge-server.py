@@ -10,13 +10,18 @@ Architecture:
 """
 
 import os
+import re
 import sys
 import logging
 import base64
 import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from requests.adapters import HTTPAdapter
 
 from flask import Flask, request, jsonify
 
@@ -28,6 +33,19 @@ BRIDGE_SECRET = os.getenv('BRIDGE_SECRET', 'change-me')
 FLASK_HOST = os.getenv('FLASK_HOST', '0.0.0.0')
 FLASK_PORT = int(os.getenv('FLASK_PORT', '5000'))
 
+# Group messages: max concurrent sends to Fossify, and how long (seconds) to
+# hold a VoIP.ms proxy send open so matching per-recipient calls can join it
+BATCH_MAX_WORKERS = int(os.getenv('BATCH_MAX_WORKERS', '4'))
+BATCH_COALESCE_WINDOW = float(os.getenv('BATCH_COALESCE_WINDOW', '0'))
+
+# Routing: numbers are normalized to E.164 using DEFAULT_REGION for national
+# formats, then matched against ROUTING_RULES ("prefix=action,...")
+DEFAULT_REGION = os.getenv('DEFAULT_REGION', 'US').upper()
+ROUTING_RULES = os.getenv('ROUTING_RULES', '')
+ROUTING_CACHE_SIZE = int(os.getenv('ROUTING_CACHE_SIZE', '4096'))
+# Extra Fossify phones: "name=url,name2=url2" (share FOSSIFY_AUTH_TOKEN)
+FOSSIFY_HANDSETS = os.getenv('FOSSIFY_HANDSETS', '')
+
 # Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -52,6 +70,170 @@ class Message:
     is_mms: bool = False
 
 
+@dataclass(frozen=True)
+class Region:
+    """Dialling conventions for national numbers in DEFAULT_REGION"""
+    country_code: str
+    trunk_prefix: str  # dropped from national numbers, '' if none
+    international_prefix: str = '00'
+    national_lengths: tuple = ()  # allowed national lengths, () if variable
+
+
+REGIONS = {
+    'US': Region('1', '1', '011', (10,)),
+    'CA': Region('1', '1', '011', (10,)),
+    'GB': Region('44', '0'),
+    'IE': Region('353', '0'),
+    'AU': Region('61', '0', '0011', (9,)),
+    'NZ': Region('64', '0'),
+    'DE': Region('49', '0'),
+    'FR': Region('33', '0', '00', (9,)),
+    'ES': Region('34', '', '00', (9,)),
+    'IT': Region('39', ''),  # leading 0 is part of the E.164 number
+    'NL': Region('31', '0', '00', (9,)),
+    'MX': Region('52', '', '00', (10,)),
+    'BR': Region('55', '0', '00', (10, 11)),
+    'IN': Region('91', '0', '00', (10,)),
+}
+DEFAULT_COUNTRY_CODE = REGIONS[DEFAULT_REGION].country_code if DEFAULT_REGION in REGIONS else None
+
+# Matches the user part of sip:/sips:/tel: URIs, with or without <> and params
+SIP_URI_RE = re.compile(r'(?:sips?|tel):([^@;>\s]+)')
+# Visual separators allowed in dialled numbers; anything else is rejected
+SEPARATOR_RE = re.compile(r'[\s\-.()]')
+DIALLED_NUMBER_RE = re.compile(r'\+?\d+')
+RULE_PREFIX_RE = re.compile(r'\+[1-9]\d*')
+
+SHORT_CODE_MAX_DIGITS = 6
+E164_MIN_DIGITS = 8
+E164_MAX_DIGITS = 15
+
+
+@lru_cache(maxsize=ROUTING_CACHE_SIZE)
+def normalize_number(raw: str, region: str = DEFAULT_REGION,
+                     international: bool = False) -> Optional[str]:
+    """
+    Normalize a phone number, SIP URI or tel: URI to E.164 (+15551234567)
+    International numbers must be written with '+' or the region's
+    international prefix (00, 011 in NANP); any other digit string is a
+    national number in `region`. With international=True, bare digits
+    already include the country code (VoIP.ms dst format).
+    Short codes (up to 6 digits) are returned as bare digits.
+    Returns None if no usable number is found.
+    """
+    if not raw:
+        return None
+    
+    value = raw.strip()
+    uri_match = SIP_URI_RE.search(value)
+    if uri_match:
+        value = uri_match.group(1)
+    
+    value = SEPARATOR_RE.sub('', value)
+    if not DIALLED_NUMBER_RE.fullmatch(value):
+        return None
+    digits = value.lstrip('+')
+    conventions = REGIONS.get(region)
+    
+    if value.startswith('+'):
+        number = digits
+    elif len(digits) <= SHORT_CODE_MAX_DIGITS:
+        return digits
+    elif international:
+        number = digits
+    elif conventions is None:
+        return None
+    else:
+        for prefix in (conventions.international_prefix, '00'):
+            if digits.startswith(prefix):
+                number = digits[len(prefix):]
+                break
+        else:
+            national = digits
+            if conventions.trunk_prefix and national.startswith(conventions.trunk_prefix):
+                national = national[len(conventions.trunk_prefix):]
+            if conventions.national_lengths and len(national) not in conventions.national_lengths:
+                return None
+            number = conventions.country_code + national
+    
+    if (number.startswith('0') or
+            not E164_MIN_DIGITS <= len(number) <= E164_MAX_DIGITS):
+        return None
+    return '+' + number
+
+
+@dataclass(frozen=True)
+class Route:
+    """Routing decision for one number"""
+    number: Optional[str]  # canonical E.164 or short code, None if invalid
+    allowed: bool
+    handset: str = 'default'
+    
+    @property
+    def error(self) -> Optional[str]:
+        """Reason a message to this number can't be sent, if any"""
+        if self.number is None:
+            return 'Invalid phone number'
+        if not self.allowed:
+            return 'Blocked by routing rules'
+        return None
+
+
+class Router:
+    """
+    Compiled routing rule table
+    Rules are "prefix=action" pairs, where action is allow, deny or the name
+    of a Fossify handset. Prefixes are E.164 and must start with '+'. The
+    longest matching prefix of the canonical number wins; '*' sets the
+    default and 'short' applies to short codes, e.g.
+    ROUTING_RULES="*=allow,short=deny,+1900=deny,+44=uk"
+    """
+    
+    def __init__(self, rules: str, handsets: List[str]):
+        self.rules: Dict[str, str] = {'*': 'allow', 'short': 'allow'}
+        for rule in filter(None, (r.strip() for r in rules.split(','))):
+            prefix, sep, action = (part.strip() for part in rule.partition('='))
+            if not sep or not prefix or not action:
+                raise ValueError(f"Invalid routing rule: {rule!r}")
+            if action not in ('allow', 'deny') and action not in handsets:
+                raise ValueError(f"Routing rule {rule!r} names unknown handset")
+            if prefix not in ('*', 'short') and not RULE_PREFIX_RE.fullmatch(prefix):
+                raise ValueError(f"Routing rule {rule!r} prefix must be '*', 'short' "
+                                 f"or an E.164 prefix such as +1900")
+            self.rules[prefix] = action
+        
+        # Prefix lengths to probe, longest first
+        self._lengths = sorted({len(p) for p in self.rules if p not in ('*', 'short')},
+                               reverse=True)
+        self.route = lru_cache(maxsize=ROUTING_CACHE_SIZE)(self._route)
+    
+    def _route(self, raw: str, international: bool = False) -> Route:
+        number = normalize_number(raw, international=international)
+        if number is None:
+            return Route(number=None, allowed=False)
+        
+        action = self.rules['*'] if number.startswith('+') else self.rules['short']
+        for length in self._lengths:
+            if length <= len(number) and number[:length] in self.rules:
+                action = self.rules[number[:length]]
+                break
+        
+        if action in ('allow', 'deny'):
+            return Route(number=number, allowed=action == 'allow')
+        return Route(number=number, allowed=True, handset=action)
+
+
+def parse_handsets(value: str) -> Dict[str, str]:
+    """Parse FOSSIFY_HANDSETS ("name=url,...") into {name: url}"""
+    handsets = {}
+    for entry in filter(None, (e.strip() for e in value.split(','))):
+        name, sep, url = (part.strip() for part in entry.partition('='))
+        if not sep or not name or not url:
+            raise ValueError(f"Invalid handset entry: {entry!r}")
+        handsets[name] = url
+    return handsets
+
+
 class FossifyAPI:
     """Client for Fossify Messages API"""
     
@@ -59,6 +241,10 @@ class FossifyAPI:
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers['Authorization'] = f'Bearer {auth_token}'
+        # Keep one pooled connection per concurrent batch worker
+        adapter = HTTPAdapter(pool_maxsize=max(1, BATCH_MAX_WORKERS))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
     
     def send_sms(self, phone_number: str, message: str) -> Dict:
         """Send SMS via Fossify Messages"""
@@ -99,10 +285,157 @@ class FossifyAPI:
         except requests.exceptions.RequestException as e:
             logger.error(f"Failed to send MMS via Fossify: {e}")
             raise
+    
+    def send_batch(self, phone_numbers: List[str], message: str,
+                   attachments: Optional[List[str]] = None) -> List[Dict]:
+        """
+        Send one message to many recipients concurrently
+        Uses MMS when attachments are given, SMS otherwise.
+        Returns one result per recipient, in order; failures don't abort the batch.
+        """
+        def send_one(phone_number: str) -> Dict:
+            try:
+                if attachments:
+                    result = self.send_mms(phone_number, message, attachments)
+                else:
+                    result = self.send_sms(phone_number, message)
+                return {'to': phone_number, 'status': 'success', 'id': result.get('id')}
+            except Exception as e:
+                return {'to': phone_number, 'status': 'error', 'error': str(e)}
+        
+        if not phone_numbers:
+            return []
+        
+        workers = max(1, min(BATCH_MAX_WORKERS, len(phone_numbers)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(send_one, phone_numbers))
+
+
+def fetch_media(media_list: List[str]) -> List[str]:
+    """
+    Convert media references to base64 attachments
+    URLs are downloaded; anything else is assumed to be base64 already.
+    Failed downloads are logged and skipped.
+    """
+    attachments = []
+    for media in media_list:
+        if not isinstance(media, str):
+            continue
+        if media.startswith('http'):
+            try:
+                logger.info(f"Downloading media: {media}")
+                media_response = requests.get(media, timeout=30)
+                media_response.raise_for_status()
+                attachments.append(base64.b64encode(media_response.content).decode('utf-8'))
+            except Exception as e:
+                logger.error(f"Failed to download media from {media}: {e}")
+        else:
+            attachments.append(media)
+    return attachments
+
+
+@dataclass
+class PendingBatch:
+    """Recipients waiting on a shared send of the same message and media"""
+    recipients: Dict[str, None] = field(default_factory=dict)  # ordered set
+    results: Dict[str, Dict] = field(default_factory=dict)
+    error: Optional[Exception] = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class SendCoalescer:
+    """
+    Coalesce back-to-back sends that share a message and media
+    mmsgate delivers a group message as one VoIP.ms call per recipient.
+    The first call opens a batch and waits `window` seconds; matching calls
+    for other recipients arriving meanwhile join it. A repeat send to a
+    recipient already in the batch starts a new batch, so resends are never
+    dropped. Media is then fetched once and the batch is sent through
+    FossifyAPI.send_batch. A window of 0 disables coalescing.
+    Numbers passed in should already be canonical (see Router).
+    """
+    
+    def __init__(self, router: Router, handsets: Dict[str, FossifyAPI],
+                 window: float):
+        self.router = router
+        self.handsets = handsets
+        self.window = window
+        self._lock = threading.Lock()
+        self._pending: Dict[tuple, PendingBatch] = {}
+    
+    def send(self, phone_numbers: List[str], message: str,
+             media: List[str]) -> List[Dict]:
+        """Fetch media once and send to all recipients, without coalescing"""
+        attachments = fetch_media(media) if media else []
+        logger.info(f"Sending {'MMS' if attachments else 'SMS'} to "
+                    f"{len(phone_numbers)} recipient(s) ({len(attachments)} attachments)")
+        
+        # One concurrent batch per handset
+        by_handset: Dict[str, List[str]] = {}
+        for number in phone_numbers:
+            by_handset.setdefault(self.router.route(number).handset, []).append(number)
+        
+        results: Dict[str, Dict] = {}
+        for handset, numbers in by_handset.items():
+            for result in self.handsets[handset].send_batch(numbers, message, attachments):
+                results[result['to']] = result
+        return [results[number] for number in phone_numbers]
+    
+    def submit(self, phone_number: str, message: str, media: List[str]) -> Dict:
+        """Send to one recipient, sharing the dispatch with matching calls"""
+        if self.window <= 0:
+            return self.send([phone_number], message, media)[0]
+        
+        key = (message, tuple(media))
+        with self._lock:
+            batch = self._pending.get(key)
+            is_leader = batch is None or phone_number in batch.recipients
+            if is_leader:
+                batch = PendingBatch()
+                self._pending[key] = batch
+            batch.recipients[phone_number] = None
+        
+        if not is_leader:
+            batch.done.wait()
+        else:
+            time.sleep(self.window)
+            with self._lock:
+                # A repeated recipient may have replaced this batch already
+                if self._pending.get(key) is batch:
+                    del self._pending[key]
+            try:
+                recipients = list(batch.recipients)
+                if len(recipients) > 1:
+                    logger.info(f"Coalesced {len(recipients)} sends into one batch")
+                results = self.send(recipients, message, media)
+                batch.results = {r['to']: r for r in results}
+            except Exception as e:
+                batch.error = e
+            finally:
+                batch.done.set()
+        
+        if batch.error:
+            raise batch.error
+        return batch.results[phone_number]
 
 
 # Initialize API clients
+# Handsets and routing rules come from config and are built by init_routing()
 fossify_api = FossifyAPI(FOSSIFY_API_URL, FOSSIFY_AUTH_TOKEN)
+fossify_handsets = {'default': fossify_api}
+router = Router('', list(fossify_handsets))
+send_coalescer = SendCoalescer(router, fossify_handsets, BATCH_COALESCE_WINDOW)
+
+
+def init_routing(rules: str, handsets: str):
+    """Build handset clients and the routing table; raises ValueError on bad config"""
+    global fossify_handsets, router, send_coalescer
+    clients = {'default': fossify_api}
+    for name, url in parse_handsets(handsets).items():
+        clients[name] = FossifyAPI(url, FOSSIFY_AUTH_TOKEN)
+    fossify_handsets = clients
+    router = Router(rules, list(clients))
+    send_coalescer = SendCoalescer(router, clients, BATCH_COALESCE_WINDOW)
 
 
 @app.route('/webhook/fossify', methods=['POST'])
@@ -130,6 +463,9 @@ def webhook_from_fossify():
             logger.error(f"No phone number in Fossify webhook: {data}")
             return jsonify({'error': 'No phone number'}), 400
         
+        # Canonical form so one contact maps to one conversation
+        from_number = normalize_number(from_number) or from_number
+        
         # Determine message type
         message_type = 'mms' if attachments else 'sms'
         
@@ -191,34 +527,26 @@ def webhook_from_linphone():
             logger.error(f"No destination number in Linphone webhook: {data}")
             return jsonify({'error': 'No destination'}), 400
         
+        route = router.route(to_number)
+        if route.error:
+            logger.warning(f"Not sending to {to_number}: {route.error}")
+            return jsonify({'error': route.error}), 400 if route.number is None else 403
+        to_number = route.number
+        api = fossify_handsets[route.handset]
+        
         # Forward to Fossify Messages to send via cellular
         if media_data:
             # MMS - media already in base64 or needs downloading
-            attachments = []
-            for media in media_data:
-                if isinstance(media, str):
-                    # Could be base64 or URL
-                    if media.startswith('http'):
-                        # Download from URL
-                        try:
-                            media_response = requests.get(media, timeout=30)
-                            media_response.raise_for_status()
-                            base64_data = base64.b64encode(media_response.content).decode('utf-8')
-                            attachments.append(base64_data)
-                        except Exception as e:
-                            logger.error(f"Failed to download media from {media}: {e}")
-                    else:
-                        # Assume already base64
-                        attachments.append(media)
+            attachments = fetch_media(media_data)
             
             if attachments:
-                fossify_api.send_mms(to_number, message_text, attachments)
+                api.send_mms(to_number, message_text, attachments)
             else:
                 # Fallback to SMS if no attachments
-                fossify_api.send_sms(to_number, message_text)
+                api.send_sms(to_number, message_text)
         else:
             # SMS
-            fossify_api.send_sms(to_number, message_text)
+            api.send_sms(to_number, message_text)
         
         return jsonify({'status': 'sent_via_cellular'}), 200
         
@@ -227,6 +555,69 @@ def webhook_from_linphone():
         return jsonify({'error': str(e)}), 500
 
 
+@app.route('/webhook/linphone/batch', methods=['POST'])
+def webhook_from_linphone_batch():
+    """
+    Send one SMS/MMS to a group of recipients via Fossify
+    Media is downloaded/encoded once and sends run concurrently
+    (up to BATCH_MAX_WORKERS). Per-recipient results are returned together.
+    """
+    try:
+        # Verify authentication
+        auth_header = request.headers.get('Authorization', '')
+        if auth_header != f"Bearer {BRIDGE_SECRET}":
+            logger.warning(f"Unauthorized Linphone batch webhook from {request.remote_addr}")
+            return jsonify({'error': 'Unauthorized'}), 401
+        
+        data = request.json
+        logger.debug(f"Received batch from Linphone: {data}")
+        
+        # Expected format: {to: ['+1234567890', ...], message: 'text', media: ['base64 or URL', ...]}
+        recipients = data.get('to', data.get('recipients', []))
+        message_text = data.get('message', data.get('text', ''))
+        media_data = data.get('media', data.get('attachments', []))
+        
+        if isinstance(recipients, str):
+            recipients = recipients.split(',')
+        if not isinstance(recipients, list):
+            logger.error(f"Invalid recipients in Linphone batch webhook: {data}")
+            return jsonify({'error': 'Recipients must be a list or comma-separated string'}), 400
+        recipients = [r for r in recipients if isinstance(r, str) and r.strip()]
+        
+        if not recipients:
+            logger.error(f"No recipients in Linphone batch webhook: {data}")
+            return jsonify({'error': 'No recipients'}), 400
+        
+        # Route each recipient; dedup on canonical number, keep order
+        routes = [router.route(recipient) for recipient in recipients]
+        sendable = list(dict.fromkeys(r.number for r in routes if not r.error))
+        
+        if not sendable:
+            results = [{'to': recipient, 'status': 'error', 'error': route.error}
+                       for recipient, route in zip(recipients, routes)]
+            logger.warning(f"No sendable recipients in Linphone batch webhook: {recipients}")
+            invalid = any(route.number is None for route in routes)
+            return jsonify({'status': 'rejected', 'results': results}), 400 if invalid else 403
+        
+        sent = {r['to']: r for r in send_coalescer.send(sendable, message_text, media_data)}
+        results = [
+            {'to': recipient, 'status': 'error', 'error': route.error} if route.error
+            else sent[route.number]
+            for recipient, route in zip(recipients, routes)
+        ]
+        
+        failed = sum(1 for r in results if r['status'] != 'success')
+        if failed == 0:
+            return jsonify({'status': 'sent_via_cellular', 'results': results}), 200
+        if failed < len(results):
+            return jsonify({'status': 'partial', 'results': results}), 207
+        return jsonify({'status': 'failed', 'results': results}), 502
+        
+    except Exception as e:
+        logger.error(f"Error in Linphone batch webhook: {e}")
+        return jsonify({'error': str(e)}), 500
+
+
 @app.route('/sip/message', methods=['POST'])
 def receive_sip_message():
     """
@@ -241,24 +632,30 @@ def receive_sip_message():
         
         # Extract phone number from SIP URI
         # Format: sip:+15551234567@domain or tel:+15551234567
-        import re
-        to_match = re.search(r'(?:sip:|tel:)\+?(\d+)', to_uri)
-        if not to_match:
+        if not SIP_URI_RE.search(to_uri):
+            return jsonify({'error': 'Invalid To address'}), 400
+        
+        route = router.route(to_uri)
+        if route.number is None:
             return jsonify({'error': 'Invalid To address'}), 400
+        if not route.allowed:
+            logger.warning(f"Not sending to {route.number}: {route.error}")
+            return jsonify({'error': route.error}), 403
         
-        to_number = '+' + to_match.group(1)
+        to_number = route.number
+        api = fossify_handsets[route.handset]
         
         # Get message body
         if content_type == 'text/plain':
             message_text = request.data.decode('utf-8')
             # Send SMS
-            fossify_api.send_sms(to_number, message_text)
+            api.send_sms(to_number, message_text)
         elif content_type.startswith('multipart/'):
             # MMS with attachments
             # Parse multipart message
             # This would need full MIME parsing
             message_text = "MMS message"  # Simplified
-            fossify_api.send_sms(to_number, message_text)
+            api.send_sms(to_number, message_text)
         
         # Return SIP 200 OK
         return '', 200
@@ -294,18 +691,23 @@ def proxy_voipms_api():
             if not dst or not message:
                 return jsonify({'status': 'error', 'error': 'Missing dst or message'}), 400
             
-            # Format phone number
-            if not dst.startswith('+'):
-                dst = '+' + dst
+            # Format phone number; VoIP.ms dst already includes the country code
+            route = router.route(dst, international=True)
+            if route.error:
+                status_code = 400 if route.number is None else 403
+                return jsonify({'status': 'error', 'error': route.error}), status_code
+            dst = route.number
             
             # Send via Fossify instead of VoIP.ms
             logger.info(f"Routing SMS to Fossify: {dst}")
-            result = fossify_api.send_sms(dst, message)
+            result = send_coalescer.submit(dst, message, [])
+            if result['status'] != 'success':
+                return jsonify({'status': 'error', 'error': result['error']}), 500
             
             # Return VoIP.ms-style response
             return jsonify({
                 'status': 'success',
-                'sms': result.get('id', int(time.time()))
+                'sms': result.get('id') or int(time.time())
             }), 200
         
         elif method == 'sendMMS':
@@ -323,34 +725,24 @@ def proxy_voipms_api():
             if not dst:
                 return jsonify({'status': 'error', 'error': 'Missing dst'}), 400
             
-            # Format phone number
-            if not dst.startswith('+'):
-                dst = '+' + dst
+            # Format phone number; VoIP.ms dst already includes the country code
+            route = router.route(dst, international=True)
+            if route.error:
+                status_code = 400 if route.number is None else 403
+                return jsonify({'status': 'error', 'error': route.error}), status_code
+            dst = route.number
             
-            # Download media and convert to base64
-            attachments = []
-            for url in media_urls:
-                try:
-                    logger.info(f"Downloading media: {url}")
-                    media_response = requests.get(url, timeout=30)
-                    media_response.raise_for_status()
-                    base64_data = base64.b64encode(media_response.content).decode('utf-8')
-                    attachments.append(base64_data)
-                except Exception as e:
-                    logger.error(f"Failed to download media from {url}: {e}")
-            
-            # Send via Fossify
-            if attachments:
-                logger.info(f"Routing MMS to Fossify: {dst} ({len(attachments)} attachments)")
-                result = fossify_api.send_mms(dst, message, attachments)
-            else:
-                logger.info(f"No attachments, routing as SMS to Fossify: {dst}")
-                result = fossify_api.send_sms(dst, message)
+            # Send via Fossify; media is downloaded once per coalesced batch
+            # and the send falls back to SMS if no attachment could be fetched
+            logger.info(f"Routing MMS to Fossify: {dst} ({len(media_urls)} media)")
+            result = send_coalescer.submit(dst, message, media_urls)
+            if result['status'] != 'success':
+                return jsonify({'status': 'error', 'error': result['error']}), 500
             
             # Return VoIP.ms-style response
             return jsonify({
                 'status': 'success',
-                'mms': result.get('id', int(time.time()))
+                'mms': result.get('id') or int(time.time())
             }), 200
         
         else:
@@ -375,6 +767,7 @@ def health():
         'status': 'ok',
         'bridge': 'sms-mms-bridge',
         'fossify_api': FOSSIFY_API_URL,
+        'handsets': list(fossify_handsets),
         'mmsgate': 'http://mmsgate:38443'
     }), 200
 
@@ -407,8 +800,22 @@ def main():
         logger.error(f"Missing required configuration: {', '.join(missing)}")
         sys.exit(1)
     
+    if DEFAULT_REGION not in REGIONS:
+        logger.error(f"Unsupported DEFAULT_REGION {DEFAULT_REGION}; "
+                     f"use one of {', '.join(sorted(REGIONS))}")
+        sys.exit(1)
+    
+    try:
+        init_routing(ROUTING_RULES, FOSSIFY_HANDSETS)
+    except ValueError as e:
+        logger.error(f"Invalid routing configuration: {e}")
+        sys.exit(1)
+    
     logger.info("SMS/MMS Bridge Server starting...")
     logger.info(f"Fossify API: {FOSSIFY_API_URL}")
+    logger.info(f"Handsets: {', '.join(fossify_handsets)}")
+    logger.info(f"Number region: {DEFAULT_REGION} (+{DEFAULT_COUNTRY_CODE}), "
+                f"{len(router.rules)} routing rules")
     logger.info(f"mmsgate webhook: http://mmsgate:38443")
     logger.info(f"Listening on {FLASK_HOST}:{FLASK_PORT}")
     
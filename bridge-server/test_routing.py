@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Tests for number normalization and routing rules in sms-bridge-server.py
+Run: python -m unittest test_routing (from bridge-server/)
+"""
+
+import importlib.util
+import os
+import tempfile
+import unittest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_bridge():
+    """Import sms-bridge-server.py (hyphenated, so not importable by name)"""
+    spec = importlib.util.spec_from_file_location(
+        'sms_bridge_server', os.path.join(HERE, 'sms-bridge-server.py'))
+    module = importlib.util.module_from_spec(spec)
+    # The server logs to bridge.log in the working directory
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            os.chdir(cwd)
+    return module
+
+
+bridge = load_bridge()
+
+# region -> [(input, expected E.164 / short code / None)]
+NORMALIZE_CASES = {
+    'US': [
+        ('5551234567', '+15551234567'),
+        ('15551234567', '+15551234567'),
+        ('(555) 123-4567', '+15551234567'),
+        ('555.123.4567', '+15551234567'),
+        ('+1 555 123 4567', '+15551234567'),
+        ('011447700900123', '+447700900123'),
+        ('00447700900123', '+447700900123'),
+        ('sip:+15551234567@example.com', '+15551234567'),
+        ('"Bob" <sip:5551234567@example.com>;tag=1', '+15551234567'),
+        ('tel:+15551234567', '+15551234567'),
+        ('22000', '22000'),
+        ('5551234', None),
+        ('555-123-4567 ext 89', None),
+        ('1-800-FLOWERS', None),
+        ('sip:user123@example.com', None),
+        ('+0', None),
+        ('', None),
+    ],
+    'CA': [
+        ('4165551234', '+14165551234'),
+        ('1 416 555 1234', '+14165551234'),
+        ('011 33 6 12 34 56 78', '+33612345678'),
+        ('sip:4165551234@example.com', '+14165551234'),
+        ('555555', '555555'),
+    ],
+    'GB': [
+        ('07700 900123', '+447700900123'),
+        ('7700900123', '+447700900123'),
+        ('020 7946 0958', '+442079460958'),
+        ('00447700900123', '+447700900123'),
+        ('0015551234567', '+15551234567'),
+        ('tel:+447700900123', '+447700900123'),
+        ('sip:07700900123@example.com', '+447700900123'),
+        ('61000', '61000'),
+    ],
+    'IE': [
+        ('087 123 4567', '+353871234567'),
+        ('00353871234567', '+353871234567'),
+        ('sip:+353871234567@example.com', '+353871234567'),
+        ('50000', '50000'),
+    ],
+    'AU': [
+        ('0412 345 678', '+61412345678'),
+        ('412345678', '+61412345678'),
+        ('0011 1 555 123 4567', '+15551234567'),
+        ('0061412345678', '+61412345678'),
+        ('041234567', None),
+        ('sip:0412345678@example.com', '+61412345678'),
+        ('199', '199'),
+    ],
+    'NZ': [
+        ('021 123 4567', '+64211234567'),
+        ('0064211234567', '+64211234567'),
+        ('tel:+64211234567', '+64211234567'),
+        ('2000', '2000'),
+    ],
+    'DE': [
+        ('0151 23456789', '+4915123456789'),
+        ('030 1234567', '+49301234567'),
+        ('004915123456789', '+4915123456789'),
+        ('sip:+4915123456789@example.com', '+4915123456789'),
+        ('22000', '22000'),
+    ],
+    'FR': [
+        ('06 12 34 56 78', '+33612345678'),
+        ('612345678', '+33612345678'),
+        ('0033612345678', '+33612345678'),
+        ('0612345', None),
+        ('sip:0612345678@example.com', '+33612345678'),
+        ('36180', '36180'),
+    ],
+    'ES': [
+        ('612 34 56 78', '+34612345678'),
+        ('0034612345678', '+34612345678'),
+        ('6123456', None),
+        ('tel:+34612345678', '+34612345678'),
+        ('22444', '22444'),
+    ],
+    'IT': [
+        ('06 1234 5678', '+390612345678'),
+        ('+39 06 1234 5678', '+390612345678'),
+        ('0039 06 1234 5678', '+390612345678'),
+        ('393 123 4567', '+393931234567'),
+        ('sip:0612345678@example.com', '+390612345678'),
+        ('48000', '48000'),
+    ],
+    'NL': [
+        ('06 12345678', '+31612345678'),
+        ('0031612345678', '+31612345678'),
+        ('sip:+31612345678@example.com', '+31612345678'),
+        ('4000', '4000'),
+    ],
+    'MX': [
+        ('55 1234 5678', '+525512345678'),
+        ('00525512345678', '+525512345678'),
+        ('551234567', None),
+        ('tel:+525512345678', '+525512345678'),
+        ('30303', '30303'),
+    ],
+    'BR': [
+        ('55 91234 5678', '+5555912345678'),
+        ('(11) 91234-5678', '+5511912345678'),
+        ('011 91234 5678', '+5511912345678'),
+        ('11 3123 4567', '+551131234567'),
+        ('005511912345678', '+5511912345678'),
+        ('sip:11912345678@example.com', '+5511912345678'),
+        ('28908', '28908'),
+    ],
+    'IN': [
+        ('91234 56789', '+919123456789'),
+        ('98765 43210', '+919876543210'),
+        ('09123456789', '+919123456789'),
+        ('00919123456789', '+919123456789'),
+        ('tel:+919123456789', '+919123456789'),
+        ('56161', '56161'),
+    ],
+}
+
+
+class NormalizeNumberTest(unittest.TestCase):
+
+    def test_every_region_has_cases(self):
+        self.assertEqual(set(NORMALIZE_CASES), set(bridge.REGIONS))
+
+    def test_region_cases(self):
+        for region, cases in NORMALIZE_CASES.items():
+            for raw, expected in cases:
+                with self.subTest(region=region, raw=raw):
+                    self.assertEqual(bridge.normalize_number(raw, region), expected)
+
+    def test_unknown_region_only_accepts_international(self):
+        self.assertEqual(bridge.normalize_number('+447700900123', 'XX'), '+447700900123')
+        self.assertIsNone(bridge.normalize_number('07700900123', 'XX'))
+
+    def test_international_digits_keep_country_code(self):
+        # VoIP.ms dst values already include the country code
+        for region in ('US', 'GB', 'IT'):
+            with self.subTest(region=region):
+                for raw, expected in [('15551234567', '+15551234567'),
+                                      ('33612345678', '+33612345678'),
+                                      ('447700900123', '+447700900123'),
+                                      ('22000', '22000'),
+                                      ('0612345678', None)]:
+                    self.assertEqual(
+                        bridge.normalize_number(raw, region, international=True), expected)
+
+
+class RouterTest(unittest.TestCase):
+
+    def test_defaults_allow(self):
+        router = bridge.Router('', ['default'])
+        self.assertEqual(router.route('+15551234567'),
+                         bridge.Route(number='+15551234567', allowed=True))
+        self.assertEqual(router.route('22000'), bridge.Route(number='22000', allowed=True))
+
+    def test_invalid_number(self):
+        route = bridge.Router('', ['default']).route('abc1')
+        self.assertIsNone(route.number)
+        self.assertEqual(route.error, 'Invalid phone number')
+
+    def test_longest_prefix_wins(self):
+        router = bridge.Router('+1=deny,+1555=allow,+15551=uk,+44=uk', ['default', 'uk'])
+        self.assertFalse(router.route('+12125551234').allowed)
+        self.assertEqual(router.route('+15559876543'),
+                         bridge.Route(number='+15559876543', allowed=True))
+        self.assertEqual(router.route('+15551234567').handset, 'uk')
+        self.assertEqual(router.route('+447700900123').handset, 'uk')
+        self.assertEqual(router.route('+33612345678').handset, 'default')
+
+    def test_default_and_short_code_rules(self):
+        router = bridge.Router('*=deny,short=deny,+44=allow', ['default'])
+        self.assertFalse(router.route('+15551234567').allowed)
+        self.assertEqual(router.route('+15551234567').error, 'Blocked by routing rules')
+        self.assertFalse(router.route('22000').allowed)
+        self.assertTrue(router.route('+447700900123').allowed)
+
+    def test_international_routing(self):
+        router = bridge.Router('+1900=deny', ['default'])
+        self.assertFalse(router.route('19005551234', international=True).allowed)
+        self.assertTrue(router.route('447700900123', international=True).allowed)
+
+    def test_invalid_rules(self):
+        for rules in ('1900=deny', '+0=deny', '+1900', '=deny', '+1900=',
+                      '+44=nowhere', '+1 900=deny'):
+            with self.subTest(rules=rules):
+                with self.assertRaises(ValueError):
+                    bridge.Router(rules, ['default'])
+
+    def test_parse_handsets(self):
+        self.assertEqual(bridge.parse_handsets(' uk=http://10.0.0.3:8080 , '),
+                         {'uk': 'http://10.0.0.3:8080'})
+        with self.assertRaises(ValueError):
+            bridge.parse_handsets('uk')
+
+
+if __name__ == '__main__':
+    unittest.main()
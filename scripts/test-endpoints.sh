@@ -23,7 +23,7 @@ echo "====================================="
 echo
 
 # Test 1: Bridge health
-echo "[1/5] Testing bridge health..."
+echo "[1/6] Testing bridge health..."
 response=$(curl -s -o /dev/null -w "%{http_code}" $BRIDGE_URL/health)
 if [ "$response" == "200" ]; then
     echo "✓ Bridge health OK"
@@ -34,7 +34,7 @@ fi
 echo
 
 # Test 2: Fossify API health
-echo "[2/5] Testing Fossify API..."
+echo "[2/6] Testing Fossify API..."
 if [ -z "$FOSSIFY_API_URL" ]; then
     echo "⊘ Fossify API URL not configured, skipping"
 else
@@ -49,7 +49,7 @@ fi
 echo
 
 # Test 3: VoIP.ms API proxy (SMS)
-echo "[3/5] Testing VoIP.ms API proxy (sendSMS)..."
+echo "[3/6] Testing VoIP.ms API proxy (sendSMS)..."
 echo "This will send a test SMS to $TEST_PHONE via Fossify"
 read -p "Continue? (y/n) " -n 1 -r
 echo
@@ -67,7 +67,7 @@ fi
 echo
 
 # Test 4: Fossify webhook receiver
-echo "[4/5] Testing Fossify webhook endpoint..."
+echo "[4/6] Testing Fossify webhook endpoint..."
 response=$(curl -s -X POST $BRIDGE_URL/webhook/fossify \
     -H "Authorization: Bearer $BRIDGE_SECRET" \
     -H "Content-Type: application/json" \
@@ -86,8 +86,41 @@ else
 fi
 echo
 
-# Test 5: End-to-end Fossify test
-echo "[5/5] Testing Fossify send_sms endpoint..."
+# Test 5: Linphone batch webhook (group message)
+echo "[5/6] Testing Linphone batch webhook..."
+response=$(curl -s -o /dev/null -w "%{http_code}" -X POST $BRIDGE_URL/webhook/linphone/batch \
+    -H "Authorization: Bearer $BRIDGE_SECRET" \
+    -H "Content-Type: application/json" \
+    -d '{"to": 5, "message": "Test group message"}')
+if [ "$response" == "400" ]; then
+    echo "✓ Batch webhook rejects invalid recipients"
+else
+    echo "✗ Batch webhook validation FAILED (HTTP $response, expected 400)"
+fi
+echo "This will send a test SMS to $TEST_PHONE via Fossify"
+read -p "Continue? (y/n) " -n 1 -r
+echo
+if [[ $REPLY =~ ^[Yy]$ ]]; then
+    response=$(curl -s -X POST $BRIDGE_URL/webhook/linphone/batch \
+        -H "Authorization: Bearer $BRIDGE_SECRET" \
+        -H "Content-Type: application/json" \
+        -d "{
+            \"to\": [\"$TEST_PHONE\"],
+            \"message\": \"Test group message from bridge\"
+        }")
+    echo "$response" | jq .
+    if echo "$response" | jq -e '.status == "sent_via_cellular"' > /dev/null 2>&1; then
+        echo "✓ Linphone batch webhook OK"
+    else
+        echo "✗ Linphone batch webhook FAILED"
+    fi
+else
+    echo "Skipped"
+fi
+echo
+
+# Test 6: End-to-end Fossify test
+echo "[6/6] Testing Fossify send_sms endpoint..."
 read -p "Send test SMS to $TEST_PHONE? (y/n) " -n 1 -r
 echo
 if [[ $REPLY =~ ^[Yy]$ ]]; then